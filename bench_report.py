@@ -0,0 +1,84 @@
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+import config
+import excel_to_md
+
+SIZES = [1000, 10000, 50000]
+NEW_ROWS = 50  # Rows added before the incremental run
+DESCRIPTION = "Responsible for site supervision, programming and subcontractor coordination. " * 40
+
+COLUMNS = ['S.N', 'Company', 'Job Position', 'Full Job Description', 'Link to post', 'Date posted']
+
+def write_synthetic_workbook(path, rows):
+    """Writes a jobs_found.xlsx-shaped workbook with `rows` postings."""
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    worksheet = workbook.add_worksheet('Sheet1')
+    worksheet.write_row(0, 0, COLUMNS)
+    for i in range(rows):
+        worksheet.write_row(i + 1, 0, [
+            i + 1,
+            f"Company {i % 500}",
+            f"Site Engineer {i}",
+            DESCRIPTION,
+            f"https://www.seek.co.nz/job/{10000000 + i}",
+            "01/01/2026",
+        ])
+    workbook.close()
+
+def legacy_convert(input_file, output_file):
+    """The original pandas + string concatenation renderer, kept as the baseline."""
+    import pandas as pd
+
+    df = pd.read_excel(input_file)
+    md_content = "# Job Search Report\n\n"
+    md_content += f"**Total Jobs Found:** {len(df)}\n"
+    md_content += f"**Generated:** {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}\n\n"
+    for index, row in df.iterrows():
+        md_content += f"## {index + 1}. {row.get('Job Position', 'N/A')} at {row.get('Company', 'N/A')}\n"
+        md_content += f"- **Date Posted:** {row.get('Date posted', 'N/A')}\n"
+        md_content += f"- **Link:** [View Job Post]({row.get('Link to post', '#')})\n\n"
+        md_content += "### Description\n"
+        md_content += f"{row.get('Full Job Description', 'No description available.')}\n\n"
+        md_content += "---\n\n"
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(md_content)
+
+def measure(fn, *args, **kwargs):
+    """Returns (seconds, peak traced MiB) for one call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+def main():
+    work_dir = tempfile.mkdtemp(prefix="bench_report_")
+    config.DATA_DIR = work_dir
+    print("=== Report Benchmark ===")
+    print(f"  {len(DESCRIPTION)} char descriptions, incremental run adds {NEW_ROWS} rows")
+
+    try:
+        for rows in SIZES:
+            workbook = os.path.join(work_dir, "jobs_found.xlsx")
+            write_synthetic_workbook(workbook, rows)
+
+            legacy = measure(legacy_convert, workbook, os.path.join(work_dir, "legacy_report.md"))
+            full = measure(excel_to_md.convert_excel_to_md)
+
+            write_synthetic_workbook(workbook, rows + NEW_ROWS)
+            incremental = measure(excel_to_md.convert_excel_to_md, incremental=True)
+
+            for label, (elapsed, peak) in [("legacy", legacy), ("streaming", full), ("incremental", incremental)]:
+                print(f"  {rows:>6} rows  {label:<12} {elapsed:7.2f} s  peak {peak:8.1f} MiB")
+    finally:
+        shutil.rmtree(work_dir)
+
+if __name__ == "__main__":
+    main()
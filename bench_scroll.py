@@ -0,0 +1,150 @@
+import asyncio
+import json
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+import config
+from browser_agent import BrowserAgent
+
+PAGE_SIZE = 20
+API_LATENCY = 0.3  # Seconds the fake results API takes to answer each page
+LEGACY_TIMEOUT = 90  # The old loop never ends on an infinite feed, so cut it off here
+
+# Results page that loads PAGE_SIZE more job cards via fetch() whenever the
+# sentinel at the bottom scrolls into view, like Seek/LinkedIn lazy loading.
+# With churn=1 a timestamped rotating ad also mutates the DOM every 100 ms.
+FIXTURE_HTML = """<!doctype html>
+<html><head><style>.card {{ height: 180px; border: 1px solid #ccc; margin: 8px; }}</style></head>
+<body>
+<div id="ad"></div>
+<div id="results"></div>
+<div id="sentinel">Loading...</div>
+<script>
+if ({churn}) {{
+    let tick = 0;
+    setInterval(() => {{
+        const ad = document.createElement('div');
+        ad.textContent = `Sponsored ${{tick++}} - ${{new Date().toISOString()}}`;
+        document.getElementById('ad').replaceChildren(ad);
+    }}, 100);
+}}
+let page = 0, done = false, loading = false;
+async function loadMore() {{
+    if (loading || done) return;
+    loading = true;
+    const res = await fetch(`/api/jobs?page=${{page++}}&total={total}`);
+    const jobs = await res.json();
+    for (const id of jobs) {{
+        const a = document.createElement('a');
+        a.className = 'card';
+        a.style.display = 'block';
+        a.href = `/job/${{id}}`;
+        a.textContent = `Job ${{id}}`;
+        document.getElementById('results').appendChild(a);
+    }}
+    done = jobs.length === 0;
+    loading = false;
+    if (done) document.getElementById('sentinel').remove();
+}}
+new IntersectionObserver(entries => {{
+    if (entries[0].isIntersecting) loadMore();
+}}).observe(document.getElementById('sentinel'));
+</script>
+</body></html>
+"""
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        total = int(query.get("total", ["0"])[0])  # 0 = infinite feed
+        churn = int(query.get("churn", ["0"])[0])
+
+        if url.path == "/api/jobs":
+            time.sleep(API_LATENCY)
+            page = int(query["page"][0])
+            start = page * PAGE_SIZE
+            stop = start + PAGE_SIZE if not total else min(start + PAGE_SIZE, total)
+            body = json.dumps(list(range(start, stop))).encode()
+            content_type = "application/json"
+        else:
+            body = FIXTURE_HTML.format(total=total, churn=churn).encode()
+            content_type = "text/html"
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+async def legacy_slow_scroll(agent):
+    """The original fixed-sleep loop, kept here as the baseline."""
+    while True:
+        scroll_amount = random.randint(400, 800)
+        await agent.page.evaluate(f"window.scrollBy(0, {scroll_amount})")
+        await asyncio.sleep(random.uniform(1, 2))
+        new_height = await agent.page.evaluate("document.body.scrollHeight")
+        current_scroll = await agent.page.evaluate("window.scrollY + window.innerHeight")
+        if current_scroll >= new_height:
+            break
+
+async def count_cards(agent):
+    return await agent.page.evaluate(
+        "() => new Set(Array.from(document.querySelectorAll('a[href*=\"/job/\"]'), a => a.href)).size"
+    )
+
+async def run_case(agent, base_url, total, churn, strategy):
+    await agent.page.goto(f"{base_url}/?total={total}&churn={churn}")
+    start = time.perf_counter()
+    if strategy == "legacy":
+        try:
+            await asyncio.wait_for(legacy_slow_scroll(agent), LEGACY_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+    else:
+        await agent.slow_scroll()
+    elapsed = time.perf_counter() - start
+    return elapsed, await count_cards(agent)
+
+async def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    config.BROWSER_DAEMON_ENABLED = False
+    config.HEADLESS_MODE = True
+    agent = BrowserAgent()
+    try:
+        await agent.start()
+    except Exception as e:
+        print(f"Could not launch Chromium ({e.__class__.__name__}); run `playwright install chromium`.")
+        await agent.stop()
+        server.shutdown()
+        return
+
+    print("=== Scroll Benchmark (lazy-loading fixture) ===")
+    print(f"  {PAGE_SIZE} cards per fetch, {API_LATENCY * 1000:.0f} ms API latency, "
+          f"MAX_SCROLLS={config.MAX_SCROLLS}, MAX_RESULTS={config.MAX_RESULTS}")
+    try:
+        cases = [
+            (40, 0, "40 results"),
+            (200, 0, "200 results"),
+            (0, 0, "infinite feed"),
+            (40, 1, "40 + DOM churn"),
+        ]
+        for total, churn, label in cases:
+            for strategy in ["legacy", "event-driven"]:
+                elapsed, cards = await run_case(agent, base_url, total, churn, strategy)
+                note = " (timed out)" if strategy == "legacy" and elapsed >= LEGACY_TIMEOUT else ""
+                print(f"  {label:<15} {strategy:<13} {elapsed:6.1f} s  {cards:4d} cards{note}")
+    finally:
+        await agent.stop()
+        server.shutdown()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+import asyncio
+import subprocess
+import sys
+import time
+import config
+from browser_agent import BrowserAgent
+
+# A tiny inline page so the measurement isn't dominated by network latency
+FIRST_PAGE = "data:text/html,<title>bench</title><h1>ready</h1>"
+RUNS = 3
+
+# What each script imported at module level before imports were made lazy,
+# used to reproduce the old eager startup as a baseline
+EAGER_IMPORTS = {
+    "main": ["pandas", "playwright.async_api", "bs4", "requests"],
+    "generate_cover_letter": ["pandas", "playwright.async_api", "bs4", "requests", "pypdf", "docx"],
+    "excel_to_md": ["pandas"],
+}
+
+def measure_import_time(module, eager=False):
+    """Wall time of a fresh interpreter importing a module, optionally with the old eager imports."""
+    imports = (EAGER_IMPORTS[module] if eager else []) + [module]
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {', '.join(imports)}"], check=True)
+    return time.perf_counter() - start
+
+async def measure_first_navigation(use_daemon):
+    """Seconds from BrowserAgent.start() to the first page having loaded."""
+    config.BROWSER_DAEMON_ENABLED = use_daemon
+    agent = BrowserAgent()
+    start = time.perf_counter()
+    try:
+        await agent.start()
+        await agent.page.goto(FIRST_PAGE)
+        elapsed = time.perf_counter() - start
+        attached = agent.attached
+    finally:
+        await agent.stop()
+    return elapsed, attached
+
+async def main():
+    print("=== Startup Benchmark ===")
+
+    for module in EAGER_IMPORTS:
+        before = min(measure_import_time(module, eager=True) for _ in range(RUNS))
+        after = min(measure_import_time(module) for _ in range(RUNS))
+        print(f"  import {module:<22} eager {before * 1000:7.1f} ms  lazy {after * 1000:7.1f} ms "
+              f"({before / after:.1f}x faster)")
+
+    try:
+        cold = [(await measure_first_navigation(False))[0] for _ in range(RUNS)]
+    except Exception as e:
+        print(f"  Could not launch Chromium ({e.__class__.__name__}); run `playwright install chromium`.")
+        return
+    print(f"  first navigation (cold launch)   best {min(cold) * 1000:7.1f} ms")
+
+    warm = []
+    for _ in range(RUNS):
+        elapsed, attached = await measure_first_navigation(True)
+        if not attached:
+            print("  Browser daemon not running; start it with `python browser_daemon.py` to compare.")
+            break
+        warm.append(elapsed)
+    if warm:
+        print(f"  first navigation (daemon attach) best {min(warm) * 1000:7.1f} ms "
+              f"({min(cold) / min(warm):.1f}x faster)")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,17 +1,79 @@
 import asyncio
 import random
-from playwright.async_api import async_playwright
 import config
 
+VIEWPORT = {'width': 1920, 'height': 1080}
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+SEEK_CARD_SELECTOR = 'a[href*="/job/"]'
+LINKEDIN_CARD_SELECTOR = 'a[href*="/jobs/view/"]'
+
+# One scroll step: scroll, wait until no result cards have been added and no XHR/fetch
+# responses have arrived for quietMs (capped at settleMs), then return every measurement
+# slow_scroll needs in a single round trip, taken after the wait. Other DOM churn
+# (ads, carousels, timers) is ignored so it can't hold every step open until settleMs.
+SCROLL_STEP_JS = """
+async ({amount, quietMs, settleMs, cardSelector}) => {
+    window.scrollBy(0, amount);
+    await new Promise(resolve => {
+        let quietTimer;
+        const finish = () => {
+            mutations.disconnect();
+            resources.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(settleTimer);
+            resolve();
+        };
+        const bump = () => {
+            clearTimeout(quietTimer);
+            quietTimer = setTimeout(finish, quietMs);
+        };
+        const addsCard = node => node.nodeType === Node.ELEMENT_NODE &&
+            (node.matches(cardSelector) || node.querySelector(cardSelector) !== null);
+        const mutations = new MutationObserver(records => {
+            if (records.some(r => Array.from(r.addedNodes).some(addsCard))) bump();
+        });
+        mutations.observe(document.body, {childList: true, subtree: true});
+        // Only responses completing during this step count, not the page's history
+        const resources = new PerformanceObserver(list => {
+            if (list.getEntries().some(e => e.initiatorType === 'fetch' || e.initiatorType === 'xmlhttprequest')) bump();
+        });
+        resources.observe({type: 'resource'});
+        quietTimer = setTimeout(finish, quietMs);
+        const settleTimer = setTimeout(finish, settleMs);
+    });
+    const scrollHeight = document.body.scrollHeight;
+    return {
+        cards: new Set(Array.from(document.querySelectorAll(cardSelector), a => a.href)).size,
+        scrollHeight: scrollHeight,
+        atBottom: window.scrollY + window.innerHeight >= scrollHeight - 2,
+    };
+}
+"""
+
 class BrowserAgent:
     def __init__(self):
+        self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
+        self.attached = False
+        self.owns_context = False
 
     async def start(self):
-        """Initializes the browser session with stealth settings."""
+        """Initializes the browser session with stealth settings.
+
+        Attaches to the browser daemon (see browser_daemon.py) if one is running,
+        otherwise falls back to launching a fresh Chromium.
+        """
+        # Imported here so commands that never open a browser don't pay for Playwright
+        from playwright.async_api import async_playwright
+
         self.playwright = await async_playwright().start()
+
+        if config.BROWSER_DAEMON_ENABLED and await self._attach():
+            return
+
         # Launch browser - consider chromium or firefox
         # Headless=False to look more human and for debugging
         self.browser = await self.playwright.chromium.launch(headless=config.HEADLESS_MODE)
@@ -19,19 +81,62 @@ class BrowserAgent:
         # Create a context with user agent steering if needed, or default
         # Viewport size can be randomized or set to standard desktop
         self.context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            viewport=VIEWPORT,
+            user_agent=USER_AGENT
         )
         self.page = await self.context.new_page()
 
+    async def _attach(self):
+        """Connects to the long-lived browser over CDP. Returns False if it isn't running."""
+        try:
+            self.browser = await self.playwright.chromium.connect_over_cdp(
+                config.BROWSER_CDP_URL, timeout=config.BROWSER_ATTACH_TIMEOUT_MS
+            )
+        except Exception:
+            print(f"  [Browser] No daemon at {config.BROWSER_CDP_URL}, launching a new browser.")
+            self.browser = None
+            return False
+
+        # Mark attached straight away so stop() never closes the daemon's own context,
+        # even if opening our page below fails
+        self.attached = True
+
+        # Reuse the daemon's persistent profile (cookies, cache) rather than a blank context
+        if self.browser.contexts:
+            self.context = self.browser.contexts[0]
+        else:
+            self.context = await self.browser.new_context(
+                viewport=VIEWPORT,
+                user_agent=USER_AGENT
+            )
+            self.owns_context = True
+        self.page = await self.context.new_page()
+        await self.page.set_viewport_size(VIEWPORT)
+        print(f"  [Browser] Attached to browser daemon at {config.BROWSER_CDP_URL}")
+        return True
+
     async def stop(self):
-        """Closes the browser session."""
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+        """Closes the browser session, leaving the daemon running if attached."""
+        try:
+            if self.attached:
+                if self.page:
+                    await self.page.close()
+                # Only close the context if we created it; the daemon's own context must survive
+                if self.owns_context and self.context:
+                    await self.context.close()
+            else:
+                if self.context:
+                    await self.context.close()
+                if self.browser:
+                    await self.browser.close()
+        except Exception as e:
+            # The page may have crashed or the daemon gone away; still release the driver
+            print(f"  [Browser] Error closing browser session: {e}")
+        finally:
+            if self.playwright:
+                # For an attached session this only drops the CDP connection
+                await self.playwright.stop()
+                self.playwright = None
 
     async def human_delay(self, min_seconds=None, max_seconds=None):
         """Sleeps for a random amount of time to simulate human behavior."""
@@ -42,34 +147,88 @@ class BrowserAgent:
         print(f"  [Stealth] Waiting for {delay:.2f} seconds...")
         await asyncio.sleep(delay)
 
-    async def slow_scroll(self):
-        """Scrolls down the page slowly to trigger lazy loading."""
+    async def slow_scroll(self, card_selector=SEEK_CARD_SELECTOR, max_scrolls=None, max_results=None):
+        """Scrolls down the page to trigger lazy loading, stopping once no new results appear.
+
+        Each step is a single evaluate that scrolls, waits until new result cards and
+        XHR/fetch responses stop arriving and then reports the page measurements. Requests started
+        during a step that outlive that window are awaited before the next step, and
+        the step doesn't count towards stopping. Requests that were already running
+        before the step (telemetry, polling) are ignored. Returns the number of
+        result cards matching card_selector.
+        """
+        if max_scrolls is None: max_scrolls = config.MAX_SCROLLS
+        if max_results is None: max_results = config.MAX_RESULTS
+
         print("  [Stealth] Scrolling page...")
-        # Get current scroll height
-        last_height = await self.page.evaluate("document.body.scrollHeight")
-        
-        while True:
-            # Scroll down a bit (random amount)
-            scroll_amount = random.randint(400, 800)
-            await self.page.evaluate(f"window.scrollBy(0, {scroll_amount})")
-            
-            # Wait to load new content
-            await self.human_delay(1, 2)
-            
-            # Calculate new scroll height and compare with last scroll height
-            new_height = await self.page.evaluate("document.body.scrollHeight")
-            
-            # If we've reached the bottom (or close enough/stop condition)
-            # For now, let's just scroll a few times or until bottom
-            # A simple heuristic: if we are near bottom, stop. 
-            # Or just scroll fixed times for search results.
-            
-            # For this initial implementation, let's scroll until bottom or max attempts
-            current_scroll = await self.page.evaluate("window.scrollY + window.innerHeight")
-            if current_scroll >= new_height:
-                break
-            
-            last_height = new_height
+        step_idle = asyncio.Event()
+        step_requests = set()
+
+        def on_request(request):
+            if request.resource_type in ("xhr", "fetch"):
+                step_requests.add(request)
+                step_idle.clear()
+
+        def on_request_done(request):
+            step_requests.discard(request)
+            if not step_requests:
+                step_idle.set()
+
+        self.page.on("request", on_request)
+        self.page.on("requestfinished", on_request_done)
+        self.page.on("requestfailed", on_request_done)
+
+        cards = 0
+        idle_steps = 0
+        try:
+            for step in range(max_scrolls):
+                # Forget requests from earlier steps so long-lived ones can't stall us
+                step_requests.clear()
+                step_idle.set()
+
+                state = await self.page.evaluate(SCROLL_STEP_JS, {
+                    "amount": random.randint(400, 800),
+                    "quietMs": config.SCROLL_QUIET_MS,
+                    "settleMs": config.SCROLL_SETTLE_MS,
+                    "cardSelector": card_selector,
+                })
+
+                # If a request this step triggered is still running, the measurement may
+                # predate its results; wait for it and let the next step count them
+                settled = not step_requests
+                if not settled:
+                    try:
+                        await asyncio.wait_for(step_idle.wait(), config.SCROLL_SETTLE_MS / 1000)
+                    except asyncio.TimeoutError:
+                        pass
+
+                new_cards = state["cards"] - cards
+                cards = state["cards"]
+
+                if max_results and cards >= max_results:
+                    print(f"  [Stealth] Reached {cards} results after {step + 1} scrolls.")
+                    break
+
+                # Stop once we're at the bottom and a few settled steps have brought nothing new
+                if state["atBottom"] and new_cards <= 0:
+                    if settled:
+                        idle_steps += 1
+                    if idle_steps >= config.SCROLL_IDLE_STEPS:
+                        print(f"  [Stealth] Reached end of page with {cards} results after {step + 1} scrolls.")
+                        break
+                else:
+                    idle_steps = 0
+
+                # Short random pause so the scroll rhythm isn't perfectly regular
+                await asyncio.sleep(random.uniform(config.SCROLL_MIN_PAUSE, config.SCROLL_MAX_PAUSE))
+            else:
+                print(f"  [Stealth] Stopped after max {max_scrolls} scrolls with {cards} results.")
+        finally:
+            self.page.remove_listener("request", on_request)
+            self.page.remove_listener("requestfinished", on_request_done)
+            self.page.remove_listener("requestfailed", on_request_done)
+
+        return cards
 
     async def navigate_to(self, url):
         """Navigates to a URL with human-like delays."""
@@ -115,5 +274,5 @@ class BrowserAgent:
         
         search_url = f"https://www.linkedin.com/jobs/search?keywords={role}&location={location}"
         await self.navigate_to(search_url)
-        await self.slow_scroll()
+        await self.slow_scroll(card_selector=LINKEDIN_CARD_SELECTOR)
 
@@ -0,0 +1,36 @@
+import asyncio
+import os
+import config
+from browser_agent import VIEWPORT, USER_AGENT
+
+async def run_daemon():
+    """Keeps a Chromium with a persistent profile running for BrowserAgent to attach to."""
+    from playwright.async_api import async_playwright
+
+    if not os.path.exists(config.BROWSER_PROFILE_DIR):
+        os.makedirs(config.BROWSER_PROFILE_DIR)
+
+    async with async_playwright() as p:
+        context = await p.chromium.launch_persistent_context(
+            config.BROWSER_PROFILE_DIR,
+            headless=config.HEADLESS_MODE,
+            viewport=VIEWPORT,
+            user_agent=USER_AGENT,
+            args=[f"--remote-debugging-port={config.BROWSER_DAEMON_PORT}"]
+        )
+        print(f"=== Browser daemon listening on {config.BROWSER_CDP_URL} ===")
+        print(f"  Profile: {config.BROWSER_PROFILE_DIR}")
+        print("  Press Ctrl+C to stop.")
+
+        closed = asyncio.Event()
+        context.on("close", lambda _: closed.set())
+        try:
+            await closed.wait()
+        finally:
+            await context.close()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(run_daemon())
+    except KeyboardInterrupt:
+        print("\nBrowser daemon stopped.")
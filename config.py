@@ -28,12 +28,35 @@ HEADLESS_MODE = False  # Set to False to see what's happening (recommended for d
 MIN_DELAY = 2
 MAX_DELAY = 5
 SCROLL_PAUSE_TIME = 1.5
+MAX_SCROLLS = 30       # Hard cap on scroll steps per results page (guards against infinite feeds)
+MAX_RESULTS = 100      # Stop scrolling once this many result cards are loaded (0 = no limit)
+SCROLL_QUIET_MS = 400  # A scroll step ends once no new result cards or XHR/fetch responses arrive for this long...
+SCROLL_SETTLE_MS = 3000  # ...or after this long at most; also caps waiting on a step's slow requests
+SCROLL_IDLE_STEPS = 2  # Steps at the bottom with no new results before we consider the page done
+SCROLL_MIN_PAUSE = 0.1
+SCROLL_MAX_PAUSE = 0.4
 PAGES_TO_SCRAPE = 3
 
+# Browser Daemon
+# Run `python browser_daemon.py` once to keep Chromium alive between runs;
+# BrowserAgent attaches to it over CDP and falls back to a cold launch if it isn't running.
+BROWSER_DAEMON_ENABLED = True
+BROWSER_DAEMON_PORT = 9222
+BROWSER_CDP_URL = f"http://localhost:{BROWSER_DAEMON_PORT}"
+BROWSER_PROFILE_DIR = "data/browser_profile"
+BROWSER_ATTACH_TIMEOUT_MS = 2000
+
 # Output Settings
 # Output Settings
 DATA_DIR = "data"
 
+# Raw Page Archive
+# Every captured detail page is stored compressed so extraction can be re-run offline
+ARCHIVE_ENABLED = True
+ARCHIVE_DIR = "data/archive"
+ARCHIVE_ZSTD_LEVEL = 10
+REEXTRACT_WORKERS = 4  # Parallel processes for `main.py --reextract`; the LLM is usually the limit
+
 # User Files
 CV_FILENAME = "Username - CV.pdf"
 TEMPLATE_FILENAME = "Username - Cover Letter Format.docx"
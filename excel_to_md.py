@@ -1,47 +1,171 @@
-import pandas as pd
+import argparse
 import os
+import re
+import shutil
+from datetime import datetime
 import config
 
-def convert_excel_to_md(input_filename="jobs_found.xlsx", output_filename="jobs_report.md"):
+SECTION_PATTERN = re.compile(r"^## (\d+)\. (.*)$")
+DATE_PATTERN = re.compile(r"^- \*\*Date Posted:\*\* (.*)$")
+LINK_PATTERN = re.compile(r"^- \*\*Link:\*\* \[View Job Post\]\((.*)\)$")
+NO_LINK = "#"
+
+def iter_jobs(input_file):
+    """Yields each job row as a dict, reading the workbook one row at a time."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(input_file, read_only=True)
+    try:
+        sheet = workbook.active
+        # Read-only mode trusts the stored <dimension>, which can be stale; read every row instead
+        sheet.reset_dimensions()
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        for values in rows:
+            if any(v is not None for v in values):
+                yield dict(zip(header, values))
+    finally:
+        workbook.close()
+
+def render_fields(job):
+    """Returns the job's fields exactly as they appear in the report."""
+    def field(key, default):
+        value = job.get(key)
+        return str(default if value is None or value == "" else value)
+
+    return {
+        "title": f"{field('Job Position', 'N/A')} at {field('Company', 'N/A')}",
+        "date": field('Date posted', 'N/A'),
+        "link": field('Link to post', NO_LINK),
+        "description": field('Full Job Description', 'No description available.'),
+    }
+
+def job_key(title, date, link):
+    """Dedupe key for incremental reports.
+
+    Postings are identified by their link. Rows without one are keyed on their
+    rendered "Position at Company" title plus the posting date instead, so they
+    are reported once rather than re-appended on every run.
+    """
+    if link != NO_LINK:
+        return link
+    return (title, date)
+
+def scan_existing_report(output_file):
+    """Returns (keys already reported, last section number) from a previous report.
+
+    A "## N. ..." line only counts as a job section when it follows the report
+    header or a "---" separator and is immediately followed by the Date Posted and
+    Link lines, so markdown headings inside job descriptions are ignored.
+    """
+    keys = set()
+    last_index = 0
+    state = "boundary"  # boundary -> date -> link -> body -> boundary
+    with open(output_file, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if state == "boundary":
+                match = SECTION_PATTERN.match(line)
+                if match:
+                    index, title = int(match.group(1)), match.group(2)
+                    state = "date"
+            elif state == "date":
+                match = DATE_PATTERN.match(line)
+                if match:
+                    date = match.group(1)
+                    state = "link"
+                else:
+                    state = "body"
+            elif state == "link":
+                match = LINK_PATTERN.match(line)
+                if match:
+                    keys.add(job_key(title, date, match.group(1)))
+                    last_index = index
+                state = "body"
+            elif line == "---":
+                state = "boundary"
+    return keys, last_index
+
+def write_job_section(f, index, fields):
+    """Writes one job's markdown section straight to the report file."""
+    f.write(f"## {index}. {fields['title']}\n"
+            f"- **Date Posted:** {fields['date']}\n"
+            f"- **Link:** [View Job Post]({fields['link']})\n\n"
+            "### Description\n"
+            f"{fields['description']}\n\n"
+            "---\n\n")
+
+def convert_excel_to_md(input_filename="jobs_found.xlsx", output_filename="jobs_report.md", incremental=False):
+    """Streams the jobs workbook into a markdown report.
+
+    With incremental=True and an existing report, only postings not already in the
+    report (see job_key) are appended, continuing its numbering and followed by the
+    new cumulative total.
+    """
     input_file = os.path.join(config.DATA_DIR, input_filename)
     output_file = os.path.join(config.DATA_DIR, output_filename)
-    
+
     if not os.path.exists(input_file):
         print(f"Error: {input_file} not found. Please run main.py first.")
         return
 
+    generated = datetime.now().strftime('%Y-%m-%d %H:%M')
+
     try:
-        df = pd.read_excel(input_file)
-        
-        # Create markdown content
-        md_content = "# Job Search Report\n\n"
-        
-        # Add summary stats
-        md_content += f"**Total Jobs Found:** {len(df)}\n"
-        md_content += f"**Generated:** {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}\n\n"
-        
-        # Iterate through jobs and format nicely
-        for index, row in df.iterrows():
-            company = row.get('Company', 'N/A')
-            position = row.get('Job Position', 'N/A')
-            date_posted = row.get('Date posted', 'N/A')
-            link = row.get('Link to post', '#')
-            description = row.get('Full Job Description', 'No description available.')
-            
-            md_content += f"## {index + 1}. {position} at {company}\n"
-            md_content += f"- **Date Posted:** {date_posted}\n"
-            md_content += f"- **Link:** [View Job Post]({link})\n\n"
-            md_content += "### Description\n"
-            md_content += f"{description}\n\n"
-            md_content += "---\n\n"
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(md_content)
-            
-        print(f"Success! Converted to {output_file}")
-            
+        if incremental and os.path.exists(output_file):
+            seen_keys, index = scan_existing_report(output_file)
+            written = 0
+            with open(output_file, "a", encoding="utf-8") as f:
+                for job in iter_jobs(input_file):
+                    fields = render_fields(job)
+                    key = job_key(fields['title'], fields['date'], fields['link'])
+                    if key in seen_keys:
+                        continue
+                    if written == 0:
+                        f.write(f"**Updated:** {generated}\n\n")
+                    index += 1
+                    written += 1
+                    seen_keys.add(key)
+                    write_job_section(f, index, fields)
+                if written:
+                    f.write(f"**New Jobs Found:** {written}\n")
+                    f.write(f"**Total Jobs Found:** {index}\n\n")
+
+            print(f"Success! Appended {written} new jobs to {output_file}")
+            return
+
+        # Sections are streamed to a body file first; the header (with the total,
+        # only known once every row is written) is then prepended in one copy pass
+        body_file = output_file + ".body.tmp"
+        tmp_file = output_file + ".tmp"
+        try:
+            count = 0
+            with open(body_file, "w", encoding="utf-8") as body:
+                for count, job in enumerate(iter_jobs(input_file), start=1):
+                    write_job_section(body, count, render_fields(job))
+
+            with open(tmp_file, "w", encoding="utf-8") as f, open(body_file, encoding="utf-8") as body:
+                f.write("# Job Search Report\n\n")
+                f.write(f"**Total Jobs Found:** {count}\n")
+                f.write(f"**Generated:** {generated}\n\n")
+                shutil.copyfileobj(body, f)
+            os.replace(tmp_file, output_file)
+        finally:
+            for leftover in (body_file, tmp_file):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+
+        print(f"Success! Converted {count} jobs to {output_file}")
+
     except Exception as e:
         print(f"Error converting file: {e}")
 
 if __name__ == "__main__":
-    convert_excel_to_md()
+    parser = argparse.ArgumentParser(description="Convert jobs_found.xlsx into a markdown report")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Append only postings not already in the existing report")
+    args = parser.parse_args()
+
+    convert_excel_to_md(incremental=args.incremental)
@@ -1,7 +1,5 @@
-import requests
 import json
 import re
-from bs4 import BeautifulSoup
 import config
 
 class JobExtractor:
@@ -14,6 +12,8 @@ class JobExtractor:
 
     def clean_html(self, raw_html):
         """Strips out unnecessary tags to save tokens."""
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(raw_html, 'html.parser')
         
         # Remove script, style, nav, footer, and other clutter
@@ -38,6 +38,8 @@ class JobExtractor:
 
     def extract_job_details(self, raw_html):
         """Sends cleaned text to LLM and returns structured JSON."""
+        import requests
+
         cleaned_text = self.clean_html(raw_html)
         
         system_prompt = (
@@ -1,10 +1,6 @@
 import asyncio
 import os
-import requests
 import json
-import pandas as pd
-from pypdf import PdfReader
-from docx import Document
 import config
 from browser_agent import BrowserAgent
 from extractor import JobExtractor
@@ -16,14 +12,12 @@ TEMPLATE_FILE = config.TEMPLATE_FILENAME
 JOBS_FILE = os.path.join(config.DATA_DIR, "jobs_found.xlsx")
 LLM_API_URL = f"{config.LLM_API_BASE}/chat/completions"
 
-async def fetch_full_job_description(url):
-    """Fetches and cleans the full job description from the URL."""
+async def fetch_full_job_description(agent, url):
+    """Fetches and cleans the full job description from the URL using an open browser session."""
     print(f"  [Browser] Fetching full JD from: {url}")
-    agent = BrowserAgent()
     extractor = JobExtractor()
     
     try:
-        await agent.start()
         await agent.navigate_to(url)
         # Wait a bit for dynamic content
         await agent.human_delay(2, 4)
@@ -33,11 +27,11 @@ async def fetch_full_job_description(url):
     except Exception as e:
         print(f"  [Browser] Error fetching JD: {e}")
         return ""
-    finally:
-        await agent.stop()
 
 def extract_text_from_pdf(pdf_path):
     """Extracts text from a PDF file."""
+    from pypdf import PdfReader
+
     try:
         reader = PdfReader(pdf_path)
         text = ""
@@ -50,6 +44,7 @@ def extract_text_from_pdf(pdf_path):
 
 def generate_cover_letter_body(cv_text, job_description, company_name, job_position):
     """Uses LLM to write the body of the cover letter."""
+    import requests
     
     system_prompt = (
         "You are a professional career coach. "
@@ -100,6 +95,7 @@ def generate_cover_letter_body(cv_text, job_description, company_name, job_posit
 def create_cover_letter_doc(body_text, output_filename, company, position):
     """Creates a new Word doc based on the template by replacing placeholders."""
     from datetime import datetime
+    from docx import Document
     
     try:
         if os.path.exists(TEMPLATE_FILE):
@@ -232,6 +228,7 @@ async def main():
 
     # 2. Read Jobs
     print("Reading Job List...")
+    import pandas as pd
     df = pd.read_excel(JOBS_FILE)
     if df.empty:
         print("No jobs found in Excel.")
@@ -245,39 +242,54 @@ async def main():
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    for index, row in df.iterrows():
-        company = row.get('Company', 'Unknown Company')
-        position = row.get('Job Position', 'Unknown Position')
-        link = row.get('Link to post', '')
+    agent = BrowserAgent()
+    try:
+        for index, row in df.iterrows():
+            company = row.get('Company', 'Unknown Company')
+            position = row.get('Job Position', 'Unknown Position')
+            link = row.get('Link to post', '')
         
-        print(f"\n--- Processing Job {index + 1}/{len(df)}: {position} at {company} ---")
+            print(f"\n--- Processing Job {index + 1}/{len(df)}: {position} at {company} ---")
         
-        description = ""
-        if link and str(link).startswith('http'):
-            # Only fetch if we haven't effectively cached it or if we want fresh
-            # For now, simplistic approach: always fetch
-            description = await fetch_full_job_description(link)
-        else:
-            print("  [Warning] No valid link found, using excel summary.")
-            description = row.get('Full Job Description', '')
+            description = ""
+            if link and str(link).startswith('http'):
+                # Only fetch if we haven't effectively cached it or if we want fresh
+                # For now, simplistic approach: always fetch
+                # One browser session is shared by every row; started on first use
+                if agent.page is None:
+                    try:
+                        await agent.start()
+                    except Exception as e:
+                        # Leave the row without a description (skipped below) and retry on the next one
+                        print(f"  [Browser] Error starting browser: {e}")
+                        await agent.stop()
+                        agent = BrowserAgent()
+                if agent.page is not None:
+                    description = await fetch_full_job_description(agent, link)
+            else:
+                print("  [Warning] No valid link found, using excel summary.")
+                description = row.get('Full Job Description', '')
 
-        if not description:
-            print("  [Skip] Could not get job description. Skipping.")
-            continue
+            if not description:
+                print("  [Skip] Could not get job description. Skipping.")
+                continue
 
-        # 4. Generate Content
-        body_text = generate_cover_letter_body(cv_text, description, company, position)
-        if not body_text or "Error" in body_text:
-             print("  [Skip] Failed to generate body text.")
-             continue
+            # 4. Generate Content
+            body_text = generate_cover_letter_body(cv_text, description, company, position)
+            if not body_text or "Error" in body_text:
+                 print("  [Skip] Failed to generate body text.")
+                 continue
 
-        # 5. Create Document
-        safe_company = "".join(c for c in str(company) if c.isalnum() or c in (' ', '_', '-')).strip()
-        safe_position = "".join(c for c in str(position) if c.isalnum() or c in (' ', '_', '-')).strip()
-        filename = f"{safe_company}_{safe_position}.docx".replace(" ", "_")
-        output_path = os.path.join(output_dir, filename)
+            # 5. Create Document
+            safe_company = "".join(c for c in str(company) if c.isalnum() or c in (' ', '_', '-')).strip()
+            safe_position = "".join(c for c in str(position) if c.isalnum() or c in (' ', '_', '-')).strip()
+            filename = f"{safe_company}_{safe_position}.docx".replace(" ", "_")
+            output_path = os.path.join(output_dir, filename)
         
-        create_cover_letter_doc(body_text, output_path, company, position)
+            create_cover_letter_doc(body_text, output_path, company, position)
+    finally:
+        if agent.playwright is not None:
+            await agent.stop()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,8 +1,11 @@
 import asyncio
-import pandas as pd
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
 import config
 from browser_agent import BrowserAgent
 from extractor import JobExtractor
+from page_archive import PageArchive
 from datetime import datetime
 
 async def main():
@@ -10,6 +13,13 @@ async def main():
     
     agent = BrowserAgent()
     extractor = JobExtractor()
+    archive = None
+    if config.ARCHIVE_ENABLED:
+        # Archiving is best-effort; an unusable ARCHIVE_DIR just disables it
+        try:
+            archive = PageArchive()
+        except Exception as e:
+            print(f"[Warning] Page archive disabled, could not open {config.ARCHIVE_DIR}: {e}")
     
     all_jobs = []
     
@@ -54,6 +64,12 @@ async def main():
                         try:
                             await agent.navigate_to(link)
                             html = await agent.get_page_content()
+                            if archive:
+                                # Archiving is best-effort; never let it cost us the extraction
+                                try:
+                                    archive.store(link, html)
+                                except Exception as e:
+                                    print(f"    [Warning] Failed to archive {link}: {e}")
                             
                             job_data = extractor.extract_job_details(html)
                             
@@ -75,10 +91,61 @@ async def main():
 
     finally:
         await agent.stop()
-        
+
+    if archive:
+        archive.print_stats()
+
+    save_jobs_to_excel(all_jobs)
+
+def _reextract_snapshot(item):
+    """Worker: re-runs cleaning and extraction on one archived page."""
+    link, digest = item
+    try:
+        html = PageArchive().load(digest)
+        job_data = JobExtractor().extract_job_details(html)
+    except Exception as e:
+        print(f"    Failed to re-extract {link}: {e}")
+        return None
+    if not job_data:
+        print(f"    Failed to extract {link}")
+        return None
+    job_data['Link to post'] = link
+    return job_data
+
+def reextract():
+    """Rebuilds the jobs spreadsheet from the raw page archive without a browser."""
+    print("=== Re-extracting from Page Archive ===")
+    archive = PageArchive()
+    archive.print_stats()
+
+    snapshots = list(archive.latest_snapshots().items())
+    if not snapshots:
+        print(f"No archived pages found in {archive.archive_dir}. Run main.py first.")
+        return
+
+    print(f"Re-extracting {len(snapshots)} pages with {config.REEXTRACT_WORKERS} workers...")
+    start = time.perf_counter()
+    all_jobs = []
+    with ProcessPoolExecutor(max_workers=config.REEXTRACT_WORKERS) as pool:
+        # Failures are logged by the worker itself
+        for job_data in pool.map(_reextract_snapshot, snapshots):
+            if job_data:
+                job_data['S.N'] = len(all_jobs) + 1
+                all_jobs.append(job_data)
+                print(f"    -> Extracted: {job_data.get('job_position', 'N/A')} at {job_data.get('company_name', 'N/A')}")
+
+    elapsed = time.perf_counter() - start
+    print(f"Re-extracted {len(all_jobs)}/{len(snapshots)} pages in {elapsed:.1f}s "
+          f"({len(snapshots) / elapsed:.2f} pages/s)")
+
+    save_jobs_to_excel(all_jobs)
+
+def save_jobs_to_excel(all_jobs):
     # Save to Excel
     print(f"\nFormatting and saving {len(all_jobs)} jobs to Excel...")
     if all_jobs:
+        import pandas as pd
+
         df = pd.DataFrame(all_jobs)
         
         # reorder columns
@@ -121,4 +188,12 @@ async def main():
             df.to_excel(os.path.join(config.DATA_DIR, "jobs_found_backup.xlsx"))
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Local-First Agentic Job Searcher")
+    parser.add_argument("--reextract", action="store_true",
+                        help="Re-run cleaning and LLM extraction over the page archive instead of crawling")
+    args = parser.parse_args()
+
+    if args.reextract:
+        reextract()
+    else:
+        asyncio.run(main())
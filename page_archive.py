@@ -0,0 +1,151 @@
+import os
+import json
+import gzip
+import hashlib
+from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit
+import config
+
+try:
+    import zstandard
+except ImportError:
+    # zstd is preferred, but fall back to gzip so the archive still works without it
+    zstandard = None
+
+
+def normalize_url(url):
+    """Reduces a job link to scheme, host and path.
+
+    Seek card links carry per-search tracking (?type=...&ref=...#sol=...), so the
+    same posting would otherwise get a new URL on every crawl.
+    """
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+
+
+class PageArchive:
+    """Content-addressed store of raw job detail pages.
+
+    Each page is compressed and stored once under the SHA-256 of its HTML,
+    and an append-only index maps every captured URL (normalized, see
+    normalize_url) to its snapshots.
+    """
+
+    def __init__(self, archive_dir=None):
+        self.archive_dir = archive_dir or config.ARCHIVE_DIR
+        self.objects_dir = os.path.join(self.archive_dir, "objects")
+        self.index_file = os.path.join(self.archive_dir, "index.jsonl")
+
+        if not os.path.exists(self.objects_dir):
+            os.makedirs(self.objects_dir)
+
+    def _object_path(self, digest, ext):
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.html{ext}")
+
+    def _find_object(self, digest):
+        """Returns the path of a stored object regardless of which codec wrote it."""
+        for ext in (".zst", ".gz"):
+            path = self._object_path(digest, ext)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _compress(self, data):
+        if zstandard is not None:
+            return zstandard.ZstdCompressor(level=config.ARCHIVE_ZSTD_LEVEL).compress(data), ".zst"
+        return gzip.compress(data), ".gz"
+
+    def _decompress(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if path.endswith(".zst"):
+            if zstandard is None:
+                raise RuntimeError(f"{path} is zstd-compressed but 'zstandard' is not installed.")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def store(self, url, html):
+        """Archives the HTML captured for a URL and returns its content hash."""
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+
+        if self._find_object(digest) is None:
+            compressed, ext = self._compress(data)
+            path = self._object_path(digest, ext)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename so a crash never leaves a truncated object behind
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, path)
+
+        entry = {
+            "url": normalize_url(url),
+            "href": url,
+            "sha256": digest,
+            "size": len(data),
+            "captured_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        with open(self.index_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+        return digest
+
+    def load(self, digest):
+        """Returns the decompressed HTML for a content hash."""
+        path = self._find_object(digest)
+        if path is None:
+            raise KeyError(f"Snapshot {digest} not found in {self.objects_dir}")
+        return self._decompress(path).decode("utf-8")
+
+    def iter_index(self):
+        """Yields every index entry in capture order."""
+        if not os.path.exists(self.index_file):
+            return
+        with open(self.index_file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    def latest_snapshots(self):
+        """Returns {url: sha256} for the most recent capture of each normalized URL."""
+        latest = {}
+        for entry in self.iter_index():
+            # Normalized again so entries indexed under a raw href still collapse
+            latest[normalize_url(entry["url"])] = entry["sha256"]
+        return latest
+
+    def stats(self):
+        """Summarises archive size and how much deduplication is saving."""
+        snapshots = 0
+        raw_bytes = 0
+        unique = {}
+        for entry in self.iter_index():
+            snapshots += 1
+            raw_bytes += entry["size"]
+            unique[entry["sha256"]] = entry["size"]
+
+        stored_bytes = 0
+        for root, _, files in os.walk(self.objects_dir):
+            for name in files:
+                if not name.endswith(".tmp"):
+                    stored_bytes += os.path.getsize(os.path.join(root, name))
+
+        unique_bytes = sum(unique.values())
+        return {
+            "snapshots": snapshots,
+            "urls": len(self.latest_snapshots()),
+            "unique_objects": len(unique),
+            "raw_bytes": raw_bytes,
+            "unique_bytes": unique_bytes,
+            "stored_bytes": stored_bytes,
+            "dedupe_ratio": raw_bytes / unique_bytes if unique_bytes else 1.0,
+            "compression_ratio": unique_bytes / stored_bytes if stored_bytes else 1.0,
+        }
+
+    def print_stats(self):
+        s = self.stats()
+        print(f"  [Archive] {s['snapshots']} snapshots of {s['urls']} URLs, {s['unique_objects']} unique pages")
+        print(f"  [Archive] Raw {s['raw_bytes'] / 1024:.1f} KiB -> stored {s['stored_bytes'] / 1024:.1f} KiB "
+              f"(dedupe {s['dedupe_ratio']:.2f}x, compression {s['compression_ratio']:.2f}x)")